@@ -10,7 +10,22 @@ hierarchy, robust validation, and transaction history management.
 """
 
 from __future__ import annotations
-from typing import List, Tuple, Union
+from array import array
+from collections import deque
+from collections.abc import Iterator, MutableSequence, Sequence
+from functools import lru_cache
+from itertools import accumulate, count, islice
+from operator import eq, itemgetter, mul
+
+# Evaluated only by type checkers (and mypyc); at runtime `typing` is not
+# imported and every annotation stays an unevaluated string.
+TYPE_CHECKING = False
+if TYPE_CHECKING:
+    from typing import Callable, ClassVar, Final, NoReturn
+
+# History record: (action, amount, balance, other account or None). Defined
+# at runtime because `TransactionHistory` subscripts `Sequence` with it.
+_Row = tuple[int, float, float, "int | None"]
 
 
 # ---------- Custom Exception Hierarchy ----------
@@ -21,23 +36,39 @@ class BankAccountError(Exception):
 
 
 class InsufficientFundsError(BankAccountError):
-    """Raised when withdrawal amount exceeds balance."""
+    """
+    Raised when withdrawal amount exceeds balance.
+
+    The message is formatted lazily in `__str__`, so raising and catching
+    the error without displaying it costs no string formatting.
+    """
 
     def __init__(self, balance: float, amount: float) -> None:
-        message = (
-            f"Insufficient funds: balance = {balance:.2f}, "
-            f"attempted = {amount:.2f}"
+        super().__init__(balance, amount)
+        self.balance = balance
+        self.amount = amount
+
+    def __str__(self) -> str:
+        return (
+            f"Insufficient funds: balance = {self.balance:.2f}, "
+            f"attempted = {self.amount:.2f}"
         )
-        super().__init__(message)
 
 
 class InvalidAmountError(BankAccountError):
-    """Raised when amount is invalid (negative or zero)."""
+    """
+    Raised when amount is invalid (negative or zero).
+
+    The offending value is kept on `value`; the message is formatted
+    lazily in `__str__`.
+    """
 
     def __init__(self, amount: object) -> None:
-        super().__init__(
-            f"Invalid amount: {amount!r}. Must be a positive number."
-        )
+        super().__init__(amount)
+        self.value = amount
+
+    def __str__(self) -> str:
+        return f"Invalid amount: {self.value!r}. Must be a positive number."
 
 
 class InvalidAccountError(BankAccountError):
@@ -47,8 +78,175 @@ class InvalidAccountError(BankAccountError):
         super().__init__(message)
 
 
+# Shared instance raised for non-positive amounts when
+# `BankAccount.fast_exceptions` is enabled; its `value` is a generic
+# description rather than the rejected amount.
+_INVALID_NONPOSITIVE: Final = InvalidAmountError("non-positive amount")
+
+
+def _raise_invalid(amount: object, fast: bool = False) -> NoReturn:
+    """
+    Raise `InvalidAmountError` for a non-positive `amount`.
+
+    With `fast`, the preallocated `_INVALID_NONPOSITIVE` is re-raised
+    instead of constructing a new exception. It is reset first so no
+    traceback, context or cause from an earlier raise is carried along.
+    The reset mutates the one shared instance, so a raise in one thread
+    clobbers the traceback of a copy another thread is still handling.
+    """
+    if fast:
+        exc = _INVALID_NONPOSITIVE
+        exc.__traceback__ = exc.__context__ = exc.__cause__ = None
+        exc.__suppress_context__ = False
+        raise exc
+    raise InvalidAmountError(amount)
+
+
+# ---------- Transaction Records ----------
+
+class Action:
+    """
+    Integer codes identifying the kind of a transaction record.
+
+    History records are fixed-shape `(action, amount, balance, other)`
+    tuples: `action` is one of these codes, `amount` and `balance` are
+    floats, and `other` is the counterparty account number for transfers
+    and None otherwise.
+    """
+
+    DEPOSIT: Final = 0
+    WITHDRAW: Final = 1
+    TRANSFER_OUT: Final = 2
+    TRANSFER_IN: Final = 3
+    CREATED: Final = 4
+
+    # Display labels, indexed by code.
+    LABELS: Final = (
+        "Deposit",
+        "Withdraw",
+        "Transfer to",
+        "Transfer from",
+        "Account created",
+    )
+
+
+# Balance effect of each action, indexed by code (creation credits the
+# opening balance).
+_ACTION_SIGNS: Final = (1.0, -1.0, -1.0, 1.0, 1.0)
+
+
+def _running_balances(rows: MutableSequence[_Row]) -> array[float]:
+    """
+    Recompute the balance after every history row from amounts alone.
+
+    The action and amount columns are built on demand as typed arrays and
+    the signed amounts are summed with `itertools.accumulate`, so the pass
+    runs in C. The sum is anchored on the oldest row's recorded balance
+    (the opening balance, unless older rows were evicted).
+    """
+    if not rows:
+        return array("d")
+    actions = array("b", map(itemgetter(0), rows))
+    amounts = array("d", map(itemgetter(1), rows))
+    signed = map(mul, map(_ACTION_SIGNS.__getitem__, actions), amounts)
+    return array(
+        "d", accumulate(islice(signed, 1, None), initial=rows[0][2])
+    )
+
+
+class TransactionHistory(Sequence[_Row]):
+    """
+    Read-only, live view of an account's transaction history.
+
+    Creating the view is O(1): it holds a reference to the account's
+    records rather than copying them, and iterating it walks them directly.
+    Later transactions on the account show up in the view. It compares
+    equal to a list or tuple holding the same records, but it is not a
+    list: use `BankAccount.copy_transaction_history()` for a mutable
+    snapshot.
+    """
+
+    __slots__ = ("_rows",)
+
+    def __init__(self, rows: MutableSequence[_Row]) -> None:
+        self._rows = rows
+
+    def __len__(self) -> int:
+        return len(self._rows)
+
+    def __getitem__(  # type: ignore[override]
+        self, index: int | slice
+    ) -> _Row | list[_Row]:
+        rows = self._rows
+        if isinstance(index, slice):
+            return [rows[i] for i in range(*index.indices(len(rows)))]
+        return rows[index]
+
+    def __iter__(self) -> Iterator[_Row]:
+        return iter(self._rows)
+
+    def __eq__(self, other: object) -> bool:
+        """Compare records by value with another history or a list/tuple."""
+        if isinstance(other, TransactionHistory):
+            other = other._rows
+        if not isinstance(other, (list, tuple, deque)):
+            return NotImplemented
+        rows = self._rows
+        return len(rows) == len(other) and all(map(eq, rows, other))
+
+    def __repr__(self) -> str:
+        return f"TransactionHistory({list(self._rows)!r})"
+
+    def labeled(self) -> list[tuple[object, ...]]:
+        """
+        Return the records with action codes replaced by display labels.
+
+        Returns
+        -------
+        list[tuple]
+            `(label, amount, balance)` rows, with the other account number
+            appended for transfers, e.g. `("Transfer to", 300.0, 800.0,
+            1002)`.
+        """
+        labels = Action.LABELS
+        return [
+            (labels[action], amount, balance) if other is None
+            else (labels[action], amount, balance, other)
+            for action, amount, balance, other in self._rows
+        ]
+
+
+# ---------- Parsing Helpers ----------
+
+@lru_cache(maxsize=1024)
+def _parse_account_data(account_data: str) -> tuple[str, float, str]:
+    """
+    Split an `"account_holder;balance;status"` string into its fields.
+
+    The function is pure, so repeated lines in bulk loads are served from
+    a bounded LRU cache; values are validated by the `BankAccount`
+    constructor, outside the cache.
+
+    Raises
+    ------
+    ValueError
+        If the balance field is not a number.
+    """
+    # Two partitions avoid building a list per parse. A missing field
+    # leaves an empty balance/status and an extra field ends up in the
+    # status text; both are rejected by the caller.
+    name, _, rest = account_data.partition(";")
+    balance_text, _, status_text = rest.partition(";")
+    return name.strip(), float(balance_text), status_text.strip()
+
+
 # ---------- BankAccount Class Implementation ----------
 
+# Bit in `BankAccount._status_flags` that is set while the account is
+# active; the per-transaction status check is a single bit test.
+_ACTIVE_FLAG: Final = 1
+
+
 class BankAccount:
     """
     Represents a bank account with deposit, withdrawal, and transfer
@@ -59,15 +257,35 @@ class BankAccount:
     - Validation with a static method (`_validate_amount`).
     - Custom exceptions for precise error handling.
     - Transaction history retention.
+    - Fixed attribute layout via `__slots__` (no per-instance `__dict__`).
     """
 
-    _account_counter: int = 1000  # auto-incrementing account number
+    __slots__ = (
+        "_account_number",
+        "_account_holder",
+        "_balance",
+        "_status_flags",
+        "_transactions",
+    )
+
+    # Auto-incrementing account number source (1001, 1002, ...). A bound
+    # `count.__next__` is a single C call and atomic under the GIL.
+    _next_number: ClassVar[Callable[[], int]] = count(1001).__next__
+
+    # When True, deposit/withdraw/apply_batch reject non-positive amounts by
+    # re-raising one shared InvalidAmountError instead of allocating a new
+    # one. Meant for batch importers that catch and skip rejected entries
+    # without inspecting the exception; its `value` is not the amount.
+    # The instance is shared by every account and thread, so leave this
+    # off when accounts may be used from several threads at once.
+    fast_exceptions: ClassVar[bool] = False
 
     def __init__(
         self,
         account_holder: str,
-        initial_balance: Union[int, float] = 0,
+        initial_balance: int | float = 0,
         status: str = "active",
+        history_capacity: int | None = None,
     ) -> None:
         """
         Initialize a new bank account.
@@ -80,17 +298,25 @@ class BankAccount:
             Starting balance (must be >= 0), by default 0.
         status : str, optional
             Account status: either "active" or "inactive", by default "active".
+        history_capacity : int, optional
+            If given, keep only the newest `history_capacity` transactions
+            in a bounded `collections.deque`; older records are discarded,
+            so memory stays fixed for long-running accounts. By default
+            (None) the full history is kept in a list.
 
         Raises
         ------
         InvalidAmountError
             If `initial_balance` is not numeric or is negative.
         InvalidAccountError
-            If `status` is not one of {"active", "inactive"}.
+            If `status` is not one of {"active", "inactive"}, or
+            `history_capacity` is not a positive integer.
         """
         # Allow zero at construction time (>= 0),
         # while operations require > 0 via _validate_amount.
-        if not isinstance(initial_balance, (int, float)):
+        t = type(initial_balance)
+        if (t is not int and t is not float
+                and not isinstance(initial_balance, (int, float))):
             raise InvalidAmountError(initial_balance)
         if initial_balance < 0:
             raise InvalidAmountError(
@@ -100,18 +326,30 @@ class BankAccount:
             raise InvalidAccountError(
                 "Status must be 'active' or 'inactive'."
             )
+        # History rows are plain (action, amount, balance, other) tuples;
+        # one list.append per transaction keeps the hot path cheap.
+        # Checked through an `object` local so a compiled (mypyc) build
+        # cannot coerce True to 1 before the exact-type test.
+        capacity: object = history_capacity
+        transactions: MutableSequence[_Row]
+        if capacity is None:
+            transactions = []
+        elif type(capacity) is int and capacity >= 1:
+            transactions = deque(maxlen=capacity)
+        else:
+            raise InvalidAccountError(
+                "History capacity must be a positive integer or None."
+            )
 
-        BankAccount._account_counter += 1
-        self._account_number: int = BankAccount._account_counter
+        self._account_number: int = BankAccount._next_number()
         self._account_holder: str = account_holder
         self._balance: float = float(initial_balance)
-        self._status: str = status
-        # (action, amount, resulting_balance[, other_account_number])
-        self._transactions: List[Tuple] = []
+        self._status_flags: int = _ACTIVE_FLAG if status == "active" else 0
+        self._transactions: MutableSequence[_Row] = transactions
 
         # Record account creation
         self._transactions.append(
-            ("Account created", self._balance, self._balance)
+            (Action.CREATED, self._balance, self._balance, None)
         )
 
     # ---------- Representation ----------
@@ -121,7 +359,7 @@ class BankAccount:
         return (
             f"BankAccount(holder={self._account_holder!r}, "
             f"number={self._account_number}, balance={self._balance:.2f}, "
-            f"status={self._status!r})"
+            f"status={self.status!r})"
         )
 
     # ---------- Property Decorators ----------
@@ -132,10 +370,13 @@ class BankAccount:
         return self._balance
 
     @balance.setter
-    def balance(self, new_value: Union[int, float]) -> None:
+    def balance(self, new_value: int | float) -> None:
         """
         Set the account balance with validation.
 
+        The change is not recorded in the transaction history, so
+        `reconcile()` will no longer end at the current balance.
+
         Parameters
         ----------
         new_value : int | float
@@ -146,7 +387,9 @@ class BankAccount:
         InvalidAmountError
             If the value is not numeric or is negative.
         """
-        if not isinstance(new_value, (int, float)):
+        t = type(new_value)
+        if (t is not int and t is not float
+                and not isinstance(new_value, (int, float))):
             raise InvalidAmountError(new_value)
         if new_value < 0:
             raise InvalidAmountError(
@@ -167,7 +410,7 @@ class BankAccount:
     @property
     def status(self) -> str:
         """str: The current account status: 'active' or 'inactive'."""
-        return self._status
+        return "active" if self._status_flags & _ACTIVE_FLAG else "inactive"
 
     @status.setter
     def status(self, value: str) -> None:
@@ -188,13 +431,16 @@ class BankAccount:
             raise InvalidAccountError(
                 "Status must be 'active' or 'inactive'."
             )
-        self._status = value
+        if value == "active":
+            self._status_flags |= _ACTIVE_FLAG
+        else:
+            self._status_flags &= ~_ACTIVE_FLAG
 
     # ---------- Class Method Decorators ----------
 
     @classmethod
     def from_balance(
-        cls, account_holder: str, initial_balance: Union[int, float]
+        cls, account_holder: str, initial_balance: int | float
     ) -> "BankAccount":
         """
         Create a new `BankAccount` using an explicit starting balance.
@@ -229,10 +475,18 @@ class BankAccount:
         InvalidAccountError
             If the string cannot be parsed or contains invalid values.
         """
+        # Checked up front rather than caught: a non-string has no
+        # `partition` and may not be hashable for the parse cache.
+        if not isinstance(account_data, str):
+            raise InvalidAccountError(
+                "Failed to parse account string: expected str, got "
+                f"{type(account_data).__name__}"
+            )
         try:
-            name, balance_text, status_text = account_data.split(";")
-            return cls(name.strip(), float(balance_text), status_text.strip())
-        except Exception as exc:  # noqa: BLE001 (keep broad for clear message)
+            return cls(*_parse_account_data(account_data))
+        # ValueError: non-numeric balance. BankAccountError: parsed values
+        # were rejected by the constructor.
+        except (ValueError, BankAccountError) as exc:
             raise InvalidAccountError(
                 f"Failed to parse account string: {exc}"
             ) from exc
@@ -240,14 +494,22 @@ class BankAccount:
     # ---------- Static Method Decorator ----------
 
     @staticmethod
-    def _validate_amount(amount: Union[int, float]) -> bool:
+    def _validate_amount(
+        amount: int | float,
+        _type: type[type] = type,
+        _int: type[int] = int,
+        _float: type[float] = float,
+        _isinstance: Callable[..., bool] = isinstance,
+        _error: type[InvalidAmountError] = InvalidAmountError,
+    ) -> bool:
         """
         Validate that an amount is numeric and strictly positive (> 0).
 
         Parameters
         ----------
         amount : int | float
-            The amount to validate.
+            The amount to validate. The underscore-prefixed parameters are
+            bind-once defaults (see below) and must not be passed.
 
         Returns
         -------
@@ -259,23 +521,30 @@ class BankAccount:
         InvalidAmountError
             If the amount is not numeric or not strictly positive.
         """
-        if not isinstance(amount, (int, float)):
-            raise InvalidAmountError(amount)
+        # Builtins and the error type are bound as default arguments, so
+        # each lookup is a fast local load rather than a global/builtin
+        # dict lookup. Exact-type identity checks cover the common case
+        # cheaply; the isinstance fallback keeps int/float subclasses
+        # (e.g. bool) valid.
+        t = _type(amount)
+        if (t is not _int and t is not _float
+                and not _isinstance(amount, (_int, _float))):
+            raise _error(amount)
         if amount <= 0:
-            raise InvalidAmountError(amount)
+            raise _error(amount)
         return True
 
     # ---------- Core Banking Operations ----------
 
     def _ensure_active(self) -> None:
         """Ensure that the account is active before a transaction."""
-        if self._status != "active":
+        if not self._status_flags & _ACTIVE_FLAG:
             raise InvalidAccountError(
                 f"Account {self._account_number} is not active for "
                 "transactions."
             )
 
-    def deposit(self, amount: Union[int, float]) -> float:
+    def deposit(self, amount: int | float) -> float:
         """
         Deposit funds into the account.
 
@@ -296,13 +565,29 @@ class BankAccount:
         InvalidAmountError
             If `amount` is not strictly positive.
         """
-        self._ensure_active()
-        self._validate_amount(amount)
-        self._balance += amount
-        self._transactions.append(("Deposit", amount, self._balance))
-        return self._balance
-
-    def withdraw(self, amount: Union[int, float]) -> float:
+        # Hot path: _ensure_active/_validate_amount are inlined to avoid
+        # two extra Python frames per transaction.
+        if not self._status_flags & _ACTIVE_FLAG:
+            raise InvalidAccountError(
+                f"Account {self._account_number} is not active for "
+                "transactions."
+            )
+        t = type(amount)
+        if (t is not int and t is not float
+                and not isinstance(amount, (int, float))):
+            raise InvalidAmountError(amount)
+        if amount <= 0:
+            _raise_invalid(amount, self.fast_exceptions)
+        # Narrow to float once so balance arithmetic is always
+        # float-with-float (no int/float mixed ops or big-int promotion).
+        if t is not float:
+            amount = float(amount)
+        balance = self._balance + amount
+        self._balance = balance
+        self._transactions.append((Action.DEPOSIT, amount, balance, None))
+        return balance
+
+    def withdraw(self, amount: int | float) -> float:
         """
         Withdraw funds from the account if sufficient balance exists.
 
@@ -325,19 +610,36 @@ class BankAccount:
         InsufficientFundsError
             If `amount` exceeds the available balance.
         """
-        self._ensure_active()
-        self._validate_amount(amount)
-        if amount > self._balance:
-            raise InsufficientFundsError(self._balance, amount)
-        self._balance -= amount
-        self._transactions.append(("Withdraw", amount, self._balance))
-        return self._balance
-
-    def transfer(self, amount: Union[int, float], target_account: "BankAccount"
+        # Hot path: see `deposit`.
+        if not self._status_flags & _ACTIVE_FLAG:
+            raise InvalidAccountError(
+                f"Account {self._account_number} is not active for "
+                "transactions."
+            )
+        t = type(amount)
+        if (t is not int and t is not float
+                and not isinstance(amount, (int, float))):
+            raise InvalidAmountError(amount)
+        if amount <= 0:
+            _raise_invalid(amount, self.fast_exceptions)
+        if t is not float:
+            amount = float(amount)
+        balance = self._balance
+        if amount > balance:
+            raise InsufficientFundsError(balance, amount)
+        balance -= amount
+        self._balance = balance
+        self._transactions.append((Action.WITHDRAW, amount, balance, None))
+        return balance
+
+    def transfer(self, amount: int | float, target_account: "BankAccount"
                  ) -> bool:
         """
         Transfer funds to another `BankAccount`.
 
+        Each side records exactly one history row ("Transfer to" /
+        "Transfer from"); no separate Withdraw/Deposit rows are added.
+
         Parameters
         ----------
         amount : int | float
@@ -353,7 +655,7 @@ class BankAccount:
         Raises
         ------
         InvalidAccountError
-            If this account is not active or target is not a BankAccount.
+            If either account is not active or target is not a BankAccount.
         InvalidAmountError
             If `amount` is not strictly positive.
         InsufficientFundsError
@@ -364,29 +666,154 @@ class BankAccount:
             raise InvalidAccountError(
                 "Target must be a BankAccount instance."
             )
+        target_account._ensure_active()
         self._validate_amount(amount)
-
-        # Perform transfer using validated operations
-        self.withdraw(amount)
-        target_account.deposit(amount)
-        self._transactions.append(
-            ("Transfer to", amount, self._balance,
-             target_account.account_number)
-        )
-        target_account._transactions.append(
-            ("Transfer from", amount, target_account._balance,
-             self.account_number)
-        )
+        value = float(amount)
+        if value > self._balance:
+            raise InsufficientFundsError(self._balance, value)
+
+        # Everything is validated up front, so move the funds directly and
+        # record a single row on each side. Each row is written right after
+        # its own leg, so a self-transfer records the debited balance on
+        # the OUT row.
+        self._balance -= value
+        self._transactions.append((
+            Action.TRANSFER_OUT, value, self._balance,
+            target_account._account_number
+        ))
+        target_account._balance += value
+        target_account._transactions.append((
+            Action.TRANSFER_IN, value, target_account._balance,
+            self._account_number
+        ))
         return True
 
-    def get_transaction_history(self) -> List[Tuple]:
+    def apply_batch(
+        self,
+        actions: Sequence[int],
+        amounts: Sequence[int | float],
+    ) -> float:
+        """
+        Apply a batch of deposits and withdrawals in one call.
+
+        The batch is all-or-nothing: every entry is validated and the
+        running balance computed in a single local loop before anything is
+        recorded, so a failing entry leaves the account untouched.
+
+        Parameters
+        ----------
+        actions : sequence of int
+            Action code per entry: `Action.DEPOSIT` or `Action.WITHDRAW`
+            (exact `int`; floats and bools are rejected).
+        amounts : sequence of int | float
+            Amount per entry (each must be > 0).
+
+        Returns
+        -------
+        float
+            The new balance after the whole batch.
+
+        Raises
+        ------
+        InvalidAccountError
+            If the account is not active, the sequences differ in length,
+            or an action code is unknown.
+        InvalidAmountError
+            If any amount is not strictly positive.
+        InsufficientFundsError
+            If any withdrawal exceeds the running balance.
+        """
+        self._ensure_active()
+        if len(actions) != len(amounts):
+            raise InvalidAccountError(
+                "Batch actions and amounts must have the same length."
+            )
+
+        fast = self.fast_exceptions
+        balance = self._balance
+        rows: list[_Row] = []
+        record = rows.append
+        deposit = Action.DEPOSIT
+        withdraw = Action.WITHDRAW
+        # Iterated as `object` so a compiled (mypyc) build cannot coerce
+        # each code to int (True to 1) before the exact-type test.
+        codes: Sequence[object] = actions
+        for action, amount in zip(codes, amounts):
+            # Exact ints only: 0.0 or True must not pass as an action code.
+            if type(action) is not int or (
+                action != deposit and action != withdraw
+            ):
+                raise InvalidAccountError(
+                    f"Unknown batch action code: {action!r}"
+                )
+            t = type(amount)
+            if (t is not int and t is not float
+                    and not isinstance(amount, (int, float))):
+                raise InvalidAmountError(amount)
+            if amount <= 0:
+                _raise_invalid(amount, fast)
+            if t is not float:
+                amount = float(amount)
+            if action == deposit:
+                balance += amount
+            else:
+                if amount > balance:
+                    raise InsufficientFundsError(balance, amount)
+                balance -= amount
+            record((action, amount, balance, None))
+
+        self._transactions.extend(rows)
+        self._balance = balance
+        return balance
+
+    def reconcile(self) -> array[float]:
+        """
+        Recompute the account's balance trajectory from its history.
+
+        Balances are rebuilt as a running sum of signed amounts, ignoring
+        the stored per-row balances, which makes this the authoritative
+        path for audits: the result should match the `balance` of each
+        history record. Its last value equals the current balance unless
+        the balance was assigned directly through the `balance` setter,
+        which is not recorded in the history; a mismatch there flags such
+        an out-of-band change. With a bounded `history_capacity`, the sum
+        starts from the oldest retained record.
+
+        Returns
+        -------
+        array.array
+            A float64 array with the balance after each transaction.
+        """
+        return _running_balances(self._transactions)
+
+    def get_transaction_history(self) -> TransactionHistory:
+        """
+        Return a read-only view of the transaction history.
+
+        The view is created in O(1) and reflects later transactions; use
+        `copy_transaction_history` for an independent, mutable list.
+        Earlier versions returned a list copy; the view supports `len`,
+        indexing, slicing, iteration and comparison with lists, but not
+        mutation.
+
+        Returns
+        -------
+        TransactionHistory
+            A sequence of `(action, amount, balance, other)` records in
+            chronological order, where `action` is an `Action` code.
+            Amounts and balances are reported as floats.
+        """
+        return TransactionHistory(self._transactions)
+
+    def copy_transaction_history(self) -> list[_Row]:
         """
         Return a copy of the transaction history.
 
         Returns
         -------
         list[tuple]
-            A list of transaction tuples in chronological order.
+            A new list of `(action, amount, balance, other)` records in
+            chronological order.
         """
         return list(self._transactions)
 
@@ -405,9 +832,9 @@ if __name__ == "__main__":
 
     # Show results with requested labels
     print("Account 1 balance:", account1.balance)
-    print("Account 1 history:", account1.get_transaction_history())
+    print("Account 1 history:", account1.get_transaction_history().labeled())
     print("Account 2 balance:", account2.balance)
-    print("Account 2 history:", account2.get_transaction_history())
+    print("Account 2 history:", account2.get_transaction_history().labeled())
 
     # Test error conditions
     try:
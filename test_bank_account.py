@@ -0,0 +1,319 @@
+"""Behaviour tests for bank_account (run with `python -m unittest`)."""
+
+import unittest
+
+from bank_account import (
+    Action,
+    BankAccount,
+    InsufficientFundsError,
+    InvalidAccountError,
+    InvalidAmountError,
+    TransactionHistory,
+)
+
+D, W = Action.DEPOSIT, Action.WITHDRAW
+
+
+class RingHistoryTests(unittest.TestCase):
+    """`history_capacity` keeps only the newest records, in order."""
+
+    def setUp(self):
+        self.account = BankAccount("Ring", 100, history_capacity=3)
+        for amount in (1, 2, 3, 4, 5):
+            self.account.deposit(amount)
+
+    def test_wraparound_keeps_newest_in_order(self):
+        history = self.account.get_transaction_history()
+        self.assertEqual(len(history), 3)
+        self.assertEqual(history, [
+            (D, 3.0, 106.0, None),
+            (D, 4.0, 110.0, None),
+            (D, 5.0, 115.0, None),
+        ])
+
+    def test_indexing_after_wraparound(self):
+        history = self.account.get_transaction_history()
+        self.assertEqual(history[0], (D, 3.0, 106.0, None))
+        self.assertEqual(history[-1], (D, 5.0, 115.0, None))
+        with self.assertRaises(IndexError):
+            history[3]
+        self.assertEqual(history[1:], [
+            (D, 4.0, 110.0, None),
+            (D, 5.0, 115.0, None),
+        ])
+        self.assertEqual(history[::-2], [
+            (D, 5.0, 115.0, None),
+            (D, 3.0, 106.0, None),
+        ])
+
+    def test_reconcile_anchors_on_oldest_retained_row(self):
+        balances = self.account.reconcile()
+        self.assertEqual(list(balances), [106.0, 110.0, 115.0])
+        self.assertEqual(balances[-1], self.account.balance)
+
+    def test_copy_is_independent_list(self):
+        copy = self.account.copy_transaction_history()
+        self.assertIsInstance(copy, list)
+        self.account.deposit(6)
+        self.assertEqual(copy[-1], (D, 5.0, 115.0, None))
+        self.assertEqual(
+            self.account.get_transaction_history()[0], (D, 4.0, 110.0, None)
+        )
+
+    def test_invalid_capacity(self):
+        for capacity in (0, -1, 2.0, True, "3"):
+            with self.subTest(capacity=capacity):
+                with self.assertRaises(InvalidAccountError):
+                    BankAccount("Ring", history_capacity=capacity)
+
+
+class ApplyBatchTests(unittest.TestCase):
+    """`apply_batch` is all-or-nothing."""
+
+    def setUp(self):
+        self.account = BankAccount("Batch", 100)
+        self.before = self.account.copy_transaction_history()
+
+    def assertUntouched(self):
+        self.assertEqual(self.account.balance, 100.0)
+        self.assertEqual(
+            self.account.copy_transaction_history(), self.before
+        )
+
+    def test_applies_all_entries(self):
+        balance = self.account.apply_batch([D, W, D], [50, 30.5, 1])
+        self.assertEqual(balance, 120.5)
+        self.assertEqual(self.account.get_transaction_history()[1:], [
+            (D, 50.0, 150.0, None),
+            (W, 30.5, 119.5, None),
+            (D, 1.0, 120.5, None),
+        ])
+
+    def test_overdraft_rolls_back_whole_batch(self):
+        with self.assertRaises(InsufficientFundsError):
+            self.account.apply_batch([D, W, D], [10, 500, 10])
+        self.assertUntouched()
+
+    def test_invalid_amount_rolls_back_whole_batch(self):
+        for bad in (0, -5, "5", None):
+            with self.subTest(amount=bad):
+                with self.assertRaises(InvalidAmountError):
+                    self.account.apply_batch([D, D], [10, bad])
+                self.assertUntouched()
+
+    def test_rejects_non_int_action_codes(self):
+        for code in (0.0, True, 9, "0"):
+            with self.subTest(code=code):
+                with self.assertRaises(InvalidAccountError):
+                    self.account.apply_batch([D, code], [10, 10])
+                self.assertUntouched()
+
+    def test_length_mismatch(self):
+        with self.assertRaises(InvalidAccountError):
+            self.account.apply_batch([D, D], [10])
+        self.assertUntouched()
+
+
+class TransferTests(unittest.TestCase):
+    """`transfer` validates both sides first and records one row each."""
+
+    def setUp(self):
+        self.source = BankAccount("Source", 500)
+        self.target = BankAccount("Target", 50)
+        self.before = (
+            self.source.copy_transaction_history(),
+            self.target.copy_transaction_history(),
+        )
+
+    def assertUntouched(self):
+        self.assertEqual(self.source.balance, 500.0)
+        self.assertEqual(self.target.balance, 50.0)
+        self.assertEqual((
+            self.source.copy_transaction_history(),
+            self.target.copy_transaction_history(),
+        ), self.before)
+
+    def test_records_one_row_per_side(self):
+        self.assertIs(self.source.transfer(100, self.target), True)
+        self.assertEqual(self.source.balance, 400.0)
+        self.assertEqual(self.target.balance, 150.0)
+        self.assertEqual(self.source.get_transaction_history()[1:], [
+            (Action.TRANSFER_OUT, 100.0, 400.0, self.target.account_number),
+        ])
+        self.assertEqual(self.target.get_transaction_history()[1:], [
+            (Action.TRANSFER_IN, 100.0, 150.0, self.source.account_number),
+        ])
+
+    def test_inactive_target_does_not_debit_source(self):
+        self.target.status = "inactive"
+        with self.assertRaises(InvalidAccountError):
+            self.source.transfer(100, self.target)
+        self.assertUntouched()
+
+    def test_rejected_transfers_leave_both_sides_untouched(self):
+        for amount, error in ((0, InvalidAmountError),
+                              ("5", InvalidAmountError),
+                              (501, InsufficientFundsError)):
+            with self.subTest(amount=amount):
+                with self.assertRaises(error):
+                    self.source.transfer(amount, self.target)
+                self.assertUntouched()
+        with self.assertRaises(InvalidAccountError):
+            self.source.transfer(100, "not an account")
+        self.assertUntouched()
+
+    def test_self_transfer_records_each_leg(self):
+        account = BankAccount("Self", 500)
+        account.transfer(100, account)
+        number = account.account_number
+        self.assertEqual(account.balance, 500.0)
+        self.assertEqual(account.get_transaction_history()[1:], [
+            (Action.TRANSFER_OUT, 100.0, 400.0, number),
+            (Action.TRANSFER_IN, 100.0, 500.0, number),
+        ])
+        self.assertEqual(
+            list(account.reconcile()),
+            [row[2] for row in account.get_transaction_history()],
+        )
+
+
+class TransactionHistoryTests(unittest.TestCase):
+
+    def setUp(self):
+        self.account = BankAccount("View", 10)
+        self.account.deposit(5)
+
+    def test_live_and_read_only(self):
+        history = self.account.get_transaction_history()
+        self.assertIsInstance(history, TransactionHistory)
+        self.account.withdraw(3)
+        self.assertEqual(len(history), 3)
+        with self.assertRaises(TypeError):
+            history[0] = (D, 1.0, 1.0, None)
+
+    def test_equality(self):
+        history = self.account.get_transaction_history()
+        rows = self.account.copy_transaction_history()
+        self.assertEqual(history, rows)
+        self.assertEqual(history, tuple(rows))
+        self.assertEqual(history, self.account.get_transaction_history())
+        self.assertNotEqual(history, rows[:1])
+        self.assertNotEqual(history, "not a history")
+
+    def test_slice_returns_list(self):
+        history = self.account.get_transaction_history()
+        self.assertEqual(history[:1], [(Action.CREATED, 10.0, 10.0, None)])
+        self.assertIsInstance(history[:], list)
+
+    def test_labeled(self):
+        target = BankAccount("Other")
+        self.account.transfer(2, target)
+        self.assertEqual(self.account.get_transaction_history().labeled(), [
+            ("Account created", 10.0, 10.0),
+            ("Deposit", 5.0, 15.0),
+            ("Transfer to", 2.0, 13.0, target.account_number),
+        ])
+
+
+class ReconcileTests(unittest.TestCase):
+
+    def test_matches_recorded_balances(self):
+        source, target = BankAccount("A", 1000), BankAccount("B", 50)
+        source.deposit(200)
+        source.withdraw(75.25)
+        source.transfer(300, target)
+        for account in (source, target):
+            with self.subTest(account=account.account_holder):
+                recorded = [
+                    row[2] for row in account.get_transaction_history()
+                ]
+                self.assertEqual(list(account.reconcile()), recorded)
+                self.assertEqual(recorded[-1], account.balance)
+
+    def test_balance_setter_is_not_recorded(self):
+        account = BankAccount("A", 10)
+        account.balance = 99
+        self.assertEqual(list(account.reconcile()), [10.0])
+
+
+class FastExceptionsTests(unittest.TestCase):
+
+    def setUp(self):
+        self.account = BankAccount("Fast", 10)
+        self.addCleanup(setattr, BankAccount, "fast_exceptions", False)
+
+    def raised(self, *amounts):
+        errors = []
+        for amount in amounts:
+            with self.assertRaises(InvalidAmountError) as cm:
+                self.account.deposit(amount)
+            errors.append(cm.exception)
+        return errors
+
+    def test_default_keeps_rejected_amount(self):
+        first, second = self.raised(0, -2)
+        self.assertIsNot(first, second)
+        self.assertEqual((first.value, second.value), (0, -2))
+
+    def test_enabled_reuses_one_instance_without_traceback_chain(self):
+        BankAccount.fast_exceptions = True
+        first, second = self.raised(0, -2)
+        self.assertIs(first, second)
+        self.assertIsNone(second.__context__)
+        # A chain attached by an earlier handler is cleared on re-raise.
+        first.__cause__ = ValueError("earlier")
+        first.__suppress_context__ = True
+        (third,) = self.raised(0)
+        self.assertIs(third, first)
+        self.assertIsNone(third.__cause__)
+        self.assertFalse(third.__suppress_context__)
+        # Non-numeric input still gets its own, descriptive error.
+        with self.assertRaises(InvalidAmountError) as cm:
+            self.account.withdraw("5")
+        self.assertEqual(cm.exception.value, "5")
+        self.assertEqual(self.account.balance, 10.0)
+
+
+class FromStringTests(unittest.TestCase):
+    """`from_string` parses `"holder;balance;status"` lines."""
+
+    def test_parses_and_strips_fields(self):
+        account = BankAccount.from_string(" Bob Wilson ; 750.5 ; inactive ")
+        self.assertEqual(account.account_holder, "Bob Wilson")
+        self.assertEqual(account.balance, 750.5)
+        self.assertEqual(account.status, "inactive")
+
+    def test_malformed_lines(self):
+        for line in ("Bob", "Bob;750", "Bob;750;active;extra",
+                     "Bob;abc;active", "Bob;-5;active", "Bob;5;frozen", ""):
+            with self.subTest(line=line):
+                with self.assertRaises(InvalidAccountError):
+                    BankAccount.from_string(line)
+
+    def test_repeated_line_builds_distinct_accounts(self):
+        # The parse cache may share fields, never accounts.
+        first = BankAccount.from_string("Bob;100;active")
+        second = BankAccount.from_string("Bob;100;active")
+        self.assertIsNot(first, second)
+        self.assertNotEqual(first.account_number, second.account_number)
+        first.deposit(50)
+        self.assertEqual(second.balance, 100.0)
+        self.assertEqual(len(second.get_transaction_history()), 1)
+
+    def test_non_string_input(self):
+        for data in (None, 5, [1], b"Bob;1;active"):
+            with self.subTest(data=data):
+                with self.assertRaises(InvalidAccountError):
+                    BankAccount.from_string(data)
+
+    def test_chains_the_underlying_error(self):
+        for line, cause in (("Bob;abc;active", ValueError),
+                            ("Bob;-5;active", InvalidAmountError)):
+            with self.subTest(line=line):
+                with self.assertRaises(InvalidAccountError) as cm:
+                    BankAccount.from_string(line)
+                self.assertIsInstance(cm.exception.__cause__, cause)
+
+
+if __name__ == "__main__":
+    unittest.main()